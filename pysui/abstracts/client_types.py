@@ -13,13 +13,11 @@
 
 
 """Type Client Abstractions."""
-from abc import ABC
-
 from types import NoneType
 from typing import Any
 
 
-class AbstractType(ABC):
+class AbstractType:
     """Base most abstraction."""
 
     def __init__(self, identifier: "AbstractType") -> None:
@@ -64,14 +62,6 @@ class AbstractType(ABC):
 class SuiBaseType(AbstractType):
     """Base most SUI object type."""
 
-    def __init__(self, identifier: Any) -> None:
-        """__init__ Initialize type with identifier.
-
-        :param identifier: A native python type
-        :type identifier: Any
-        """
-        super().__init__(identifier)
-
 
 class SuiScalarType(SuiBaseType):
     """Base most SUI scalar type."""
@@ -128,12 +128,9 @@ class SuiBaseBuilder(Builder):
     )
     def _pull_vars(self) -> dict:
         """Filter out private/protected var elements."""
-        var_map = vars(self)
-        outparms = {}
-        for key, value in var_map.items():
-            if key[0] != "_":
-                outparms[key] = value
-        return outparms
+        return {
+            key: value for key, value in vars(self).items() if key[0] != "_"
+        }
 
     @versionchanged(
         version="0.24.0", reason="Moved from list to dict for RPC params"
@@ -239,14 +239,16 @@ class PureInput:
     @classmethod
     def _(cls, arg: bcs.Address) -> list:
         """Convert bcs.Address to list of bytes."""
-        logger.debug(f"bcs.Address->pure {arg.to_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"bcs.Address->pure {arg.to_json()}")
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.Digest) -> list:
         """Convert bcs,Digest to list of bytes."""
-        logger.debug(f"bcs.Digest->pure {arg.to_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"bcs.Digest->pure {arg.to_json()}")
         return list(arg.serialize())
 
     @pure.register
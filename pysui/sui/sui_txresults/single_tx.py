@@ -13,9 +13,11 @@
 
 """Types return from single transactions."""
 
-
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Optional, Union
+from operator import itemgetter
+from typing import Any, Callable, Optional, Union
 
 from dataclasses_json import DataClassJsonMixin, LetterCase, config
 from deprecated.sphinx import versionchanged
@@ -23,6 +25,20 @@ from deprecated.sphinx import versionchanged
 from pysui.sui.sui_txresults.common import GenericRef
 from pysui.sui.sui_types import ObjectID, SuiAddress
 
+# Positional order of the ObjectReadData constructor arguments
+_CONTENT_KEYS = itemgetter("hasPublicTransfer", "fields", "dataType", "type")
+
+
+def _as_str(value: Any) -> Optional[str]:
+    """Coerce a str annotated value as dataclasses_json decoding does, None excepted."""
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _as_dict(value: Optional[dict]) -> Optional[dict]:
+    """Shallow copy a dict annotated value as dataclasses_json decoding does, None excepted."""
+    return value if value is None else dict(value)
+
+
 # pylint:disable=too-many-instance-attributes
 # Faucet results
 
@@ -49,7 +65,7 @@ class FaucetGasRequest(DataClassJsonMixin):
 # ObjectRead
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectReadData(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -57,18 +73,42 @@ class ObjectReadData(DataClassJsonMixin):
     fields: dict
     data_type: str = field(metadata=config(field_name="dataType"))
     type_: str = field(metadata=config(field_name="type"))
-    type_arg: str = field(default_factory=str)
+    type_arg: Optional[str] = None
 
     def __post_init__(self):
         """Post init processing for parameters."""
-        ref = self.type_.split("<", 1)
-        if len(ref) > 1:
-            self.type_arg = ref[1][:-1]
+        if self.type_arg is None:
+            _, generic, type_arg = self.type_.partition("<")
+            self.type_arg = type_arg[:-1] if generic else ""
         if "id" in self.fields:
             self.fields["id"] = self.fields["id"]["id"]
 
+    @classmethod
+    def from_content(
+        cls, content: dict, type_arg: Optional[str] = None
+    ) -> "ObjectReadData":
+        """from_content instantiates directly from an object's `content` block.
+
+        Calls the generated dataclass constructor rather than decoding through `from_dict`.
+
+        :param content: The `content` dictionary of a Move object read
+        :type content: dict
+        :param type_arg: The already parsed generic type argument, defaults to None
+        :type type_arg: Optional[str], optional
+        :return: Instance of the ObjectReadData subclass
+        :rtype: ObjectReadData
+        """
+        has_public_transfer, fields, data_type, type_ = _CONTENT_KEYS(content)
+        return cls(
+            has_public_transfer,
+            dict(fields),
+            sys.intern(data_type),
+            sys.intern(type_),
+            type_arg,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class ObjectPackageReadData(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -81,7 +121,7 @@ class ObjectPackageReadData(DataClassJsonMixin):
         self.type_ = self.data_type
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectNotExist(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -95,7 +135,7 @@ class ObjectNotExist(DataClassJsonMixin):
         return ObjectID(self.object_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectVersionNotFound(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -109,7 +149,7 @@ class ObjectVersionNotFound(DataClassJsonMixin):
         return ObjectID(self.object_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectVersionTooHigh(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -124,7 +164,7 @@ class ObjectVersionTooHigh(DataClassJsonMixin):
         return ObjectID(self.object_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectDeleted(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -139,7 +179,7 @@ class ObjectDeleted(DataClassJsonMixin):
         return self.object_id
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressOwner(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -147,7 +187,7 @@ class AddressOwner(DataClassJsonMixin):
     address_owner: str = field(metadata=config(field_name="owner"))
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectOwner(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -155,7 +195,7 @@ class ObjectOwner(DataClassJsonMixin):
     object_owner: str = field(metadata=config(field_name="owner"))
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedOwner(DataClassJsonMixin):
     """From sui_getObject."""
 
@@ -164,24 +204,58 @@ class SharedOwner(DataClassJsonMixin):
     mutable: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImmutableOwner(DataClassJsonMixin):
     """From sui_getObject."""
 
     owner_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NotRequestedOwner(DataClassJsonMixin):
     """From sui_getObject."""
 
     owner_type: str
 
 
+def _address_owner(owner_type: str, owner_value: str, _content: Any) -> AddressOwner:
+    """Owned by an address."""
+    return AddressOwner(owner_type, sys.intern(owner_value))
+
+
+def _object_owner(owner_type: str, owner_value: str, _content: Any) -> ObjectOwner:
+    """Owned by another object."""
+    return ObjectOwner(owner_type, sys.intern(owner_value))
+
+
+def _shared_owner(owner_type: str, owner_value: dict, content: Any) -> SharedOwner:
+    """Shared, mutable if the content has public transfer."""
+    return SharedOwner(
+        owner_type,
+        str(owner_value["initial_shared_version"]),
+        bool(content and content.has_public_transfer),
+    )
+
+
+def _immutable_owner(
+    owner_type: str, _owner_value: Any, _content: Any
+) -> ImmutableOwner:
+    """Immutable object."""
+    return ImmutableOwner(owner_type)
+
+
+# Owner kind key to owner constructor
+_OWNER_HANDLERS: dict[str, Callable[[str, Any, Any], Any]] = {
+    "AddressOwner": _address_owner,
+    "ObjectOwner": _object_owner,
+    "Shared": _shared_owner,
+    "Immutable": _immutable_owner,
+}
+
 # Object Raw Data
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectRawData(DataClassJsonMixin):
     """From sui_getRawObject."""
 
@@ -201,7 +275,7 @@ class ObjectRawData(DataClassJsonMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayFields(DataClassJsonMixin):
     """From GetObject."""
 
@@ -209,7 +283,47 @@ class DisplayFields(DataClassJsonMixin):
     error: Optional[dict]
 
 
-@dataclass
+# Captures the coin struct name from `Coin<address::module::struct>`
+_COIN_TYPE_RE = re.compile(r"Coin<(?:[^:]+::){2}([^>]+)>")
+
+# Move object type signature to content class and type argument,
+# resolved once per signature
+_CONTENT_TYPE_CACHE: dict[str, tuple[type, str]] = {}
+
+
+def _content_type(type_sig: str) -> tuple[type, str]:
+    """_content_type resolves the ObjectReadData subclass and type argument of a Move object type.
+
+    :param type_sig: The Move object type signature (e.g. `0x2::coin::Coin<0x2::sui::SUI>`)
+    :type type_sig: str
+    :return: The class to instantiate the object content with and its generic type argument
+    :rtype: tuple[type, str]
+    """
+    content_type = _CONTENT_TYPE_CACHE.get(type_sig)
+    if content_type is None:
+        address, _, remainder = type_sig.partition("::")
+        module, _, struct = remainder.partition("::")
+        if address == "0x2":
+            match module:
+                case "coin":
+                    coin = _COIN_TYPE_RE.match(struct)
+                    if not coin:
+                        content_class = SuiData
+                    elif coin.group(1) == "SUI":
+                        content_class = SuiGas
+                    else:
+                        content_class = SuiCoin
+                case _:
+                    content_class = SuiData
+        else:
+            content_class = SuiData
+        _, generic, type_arg = type_sig.partition("<")
+        content_type = (content_class, type_arg[:-1] if generic else "")
+        _CONTENT_TYPE_CACHE[type_sig] = content_type
+    return content_type
+
+
+@dataclass(slots=True)
 class ObjectRead(DataClassJsonMixin):
     """ObjectRead is base sui_getObject result."""
 
@@ -244,52 +358,47 @@ class ObjectRead(DataClassJsonMixin):
             self.bcs = self.content = ObjectRawData.from_dict(self.bcs)
         else:
             if self.content and "type" in self.content:
-                split = self.content["type"].split("::", 2)
-                if split[0] == "0x2":
-                    match split[1]:
-                        case "coin":
-                            split2 = split[2][5:-1].split("::")
-                            if split2[2] == "SUI":
-                                self.content = SuiGas.from_dict(self.content)
-                            else:
-                                self.content = SuiCoin.from_dict(self.content)
-                        case _:
-                            self.content = SuiData.from_dict(self.content)
-                else:
-                    self.content = SuiData.from_dict(self.content)
+                content_class, type_arg = _content_type(self.content["type"])
+                self.content = content_class.from_content(self.content, type_arg)
 
         if isinstance(self.owner, str):
             match self.owner:
                 case "Immutable":
-                    self.owner = ImmutableOwner.from_dict({"owner_type": "Immutable"})
+                    self.owner = ImmutableOwner("Immutable")
                 case _:
-                    self.owner = NotRequestedOwner.from_dict(
-                        {"owner_type": "Filter excluded"}
-                    )
+                    self.owner = NotRequestedOwner("Filter excluded")
                     # raise AttributeError(f"{self.owner} not handled")
         else:
-            vlist = list(self.owner.items())
-            match vlist[0][0]:
-                case "AddressOwner":
-                    sdict = {}
-                    sdict["address_owner"] = vlist[0][1]
-                    sdict["owner_type"] = "AddressOwner"
-                    self.owner = AddressOwner.from_dict(sdict)
-                case "ObjectOwner":
-                    sdict = {}
-                    sdict["object_owner"] = vlist[0][1]
-                    sdict["owner_type"] = "ObjectOwner"
-                    self.owner = ObjectOwner.from_dict(sdict)
-                case "Shared":
-                    sdict = vlist[0][1]
-                    sdict["owner_type"] = "Shared"
-                    if self.content and self.content.has_public_transfer:
-                        sdict["mutable"] = True
-                    else:
-                        sdict["mutable"] = False
-                    self.owner = SharedOwner.from_dict(sdict)
-                case "Immutable":
-                    self.owner = ImmutableOwner.from_dict({})
+            owner_type, owner_value = next(iter(self.owner.items()))
+            owner_handler = _OWNER_HANDLERS.get(owner_type)
+            if owner_handler:
+                self.owner = owner_handler(owner_type, owner_value, self.content)
+
+    @classmethod
+    def from_data(cls, indata: dict) -> "ObjectRead":
+        """from_data instantiates directly from an object read `data` block.
+
+        Calls the generated dataclass constructor rather than decoding through `from_dict`,
+        applying the same str coercion and dictionary copies that `from_dict` does.
+
+        :param indata: The `data` dictionary of a `sui_getObject` result
+        :type indata: dict
+        :return: Instance of ObjectRead
+        :rtype: ObjectRead
+        """
+        object_type = _as_str(indata.get("type", ""))
+        return cls(
+            version=_as_str(indata["version"]),
+            object_id=_as_str(indata["objectId"]),
+            previous_transaction=_as_str(indata.get("previousTransaction", "")),
+            object_type=sys.intern(object_type) if object_type else object_type,
+            storage_rebate=_as_str(indata.get("storageRebate", 0)),
+            content=_as_dict(indata.get("content", {})),
+            bcs=_as_dict(indata.get("bcs", {})),
+            digest=_as_str(indata.get("digest", "")),
+            display=_as_dict(indata.get("display", {})),
+            owner=indata.get("owner", ""),
+        )
 
     @property
     def identifier(self) -> ObjectID:
@@ -334,7 +443,7 @@ class ObjectRead(DataClassJsonMixin):
             indata = indata["details"]
             match instatus:
                 case "VersionFound":
-                    result = ObjectRead.from_dict(indata)
+                    result = ObjectRead.from_data(indata)
                 case "VersionNotFound":
                     vth = {
                         "code": "notExist",
@@ -343,23 +452,27 @@ class ObjectRead(DataClassJsonMixin):
                     }
                     result = ObjectNotExist.from_dict(vth)
                 case "VersionTooHigh":
-                    indata["code"] = instatus
-                    result = ObjectVersionTooHigh.from_dict(indata)
+                    result = ObjectVersionTooHigh(
+                        _as_str(indata["asked_version"]),
+                        _as_str(indata["latest_version"]),
+                        _as_str(indata["object_id"]),
+                        instatus,
+                    )
                 case "ObjectNotExists":
                     vth = {"code": "notExist", "object_id": indata}
                     result = ObjectNotExist.from_dict(vth)
                 case "ObjectDeleted":
-                    vth = {
-                        "code": instatus,
-                        "digest": indata["digest"],
-                        "object_id": indata["objectId", "version" : indata["version"]],
-                    }
-                    ObjectDeleted.from_dict(vth)
+                    result = ObjectDeleted(
+                        instatus,
+                        _as_str(indata["objectId"]),
+                        _as_str(indata["digest"]),
+                        _as_str(indata["version"]),
+                    )
                 case _:
                     result = None
         elif "data" in indata:
             target = indata["data"]
-            result = ObjectRead.from_dict(target)
+            result = ObjectRead.from_data(target)
         else:
             indata = indata["error"]
             match indata["code"]:
@@ -462,7 +575,7 @@ class ObjectRawRead(DataClassJsonMixin):
         return cls._differentiate(indata)
 
 
-@dataclass
+@dataclass(slots=True)
 class SuiPackage(ObjectPackageReadData):
     """SuiPackage is a package object.
 
@@ -473,7 +586,7 @@ class SuiPackage(ObjectPackageReadData):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class SuiData(ObjectReadData):
     """SuiData is object that is not coins.
 
@@ -484,7 +597,7 @@ class SuiData(ObjectReadData):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class SuiCoin(ObjectReadData):
     """SuiCoinType is the generic coin.
 
@@ -494,8 +607,17 @@ class SuiCoin(ObjectReadData):
     :rtype: SuiCoin
     """
 
+    @property
+    def balance(self) -> int:
+        """balance returns the balance of coin<type> for this object.
 
-@dataclass
+        :return: balance value
+        :rtype: int
+        """
+        return int(self.fields["balance"])
+
+
+@dataclass(slots=True)
 class SuiGas(SuiCoin):
     """SuiGasType is SUI Gas coin object type.
 
@@ -505,15 +627,6 @@ class SuiGas(SuiCoin):
     :rtype: SuiGas
     """
 
-    @property
-    def balance(self) -> int:
-        """balance returns the balance of coin<type> for this object.
-
-        :return: balance value
-        :rtype: int
-        """
-        return int(self.fields["balance"])
-
 
 # Committee
 
@@ -13,7 +13,7 @@
 
 """Sui Collection Types."""
 
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar, Union
 from deprecated.sphinx import versionchanged
 from pysui.abstracts import SuiBaseType
@@ -171,7 +171,7 @@ class SuiMap(SuiCollection):
         return self.map
 
 
-class BatchParameter(SuiMap):
+class BatchParameter(SuiMap, ABC):
     """BatchParameter is abstraction for TransferObjectParams and MoveCallRequestParams."""
 
     @abstractmethod
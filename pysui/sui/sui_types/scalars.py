@@ -89,14 +89,6 @@ class SuiNullType(SuiScalarType):
 class SuiString(SuiScalarType):
     """Sui String type."""
 
-    def __init__(self, identifier: str) -> None:
-        """__init__ Native string initializing SuiString.
-
-        :param identifier: A python str
-        :type identifier: str
-        """
-        super().__init__(identifier)
-
     @property
     def id(self) -> str:
         """Alias for transactions."""
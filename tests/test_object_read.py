@@ -0,0 +1,212 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing ObjectRead result differentiation (no network)."""
+
+import copy
+
+import pytest
+
+from pysui.sui.sui_txresults.single_tx import (
+    _content_type,
+    AddressOwner,
+    ImmutableOwner,
+    ObjectDeleted,
+    ObjectOwner,
+    ObjectRead,
+    ObjectVersionTooHigh,
+    SharedOwner,
+    SuiCoin,
+    SuiData,
+    SuiGas,
+)
+
+
+def _owned_read(owner) -> ObjectRead:
+    """Differentiate a content-less object read with the given owner."""
+    return ObjectRead.differentiate(
+        {"data": {"objectId": "0x1", "version": "1", "owner": owner}}
+    )
+
+
+def _content_read(type_sig: str, fields: dict) -> ObjectRead:
+    """Differentiate an object read whose content has the given type."""
+    return ObjectRead.differentiate(
+        {
+            "data": {
+                "objectId": "0x1",
+                "version": "1",
+                "type": type_sig,
+                "content": {
+                    "dataType": "moveObject",
+                    "type": type_sig,
+                    "hasPublicTransfer": True,
+                    "fields": fields,
+                },
+            }
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "type_sig, content_class, type_arg",
+    [
+        ("0x2::coin::Coin<0x2::sui::SUI>", SuiGas, "0x2::sui::SUI"),
+        ("0x2::coin::Coin<0xa::usdc::USDC>", SuiCoin, "0xa::usdc::USDC"),
+        ("0x2::coin::TreasuryCap<0x2::sui::SUI>", SuiData, "0x2::sui::SUI"),
+        (
+            "0x2::coin::CoinMetadata<0xa::usdc::USDC>",
+            SuiData,
+            "0xa::usdc::USDC",
+        ),
+        ("0x9::coin::Coin<0x2::sui::SUI>", SuiData, "0x2::sui::SUI"),
+        ("0x9::m::S", SuiData, ""),
+    ],
+)
+def test_content_type(type_sig, content_class, type_arg) -> None:
+    """Only 0x2::coin::Coin types resolve to the coin content classes."""
+    assert _content_type(type_sig) == (content_class, type_arg)
+
+
+def test_object_deleted() -> None:
+    """ObjectDeleted status yields an ObjectDeleted with str fields."""
+    indata = {
+        "status": "ObjectDeleted",
+        "details": {"objectId": "0x5", "digest": "dgst", "version": 2},
+    }
+    result = ObjectRead.differentiate(indata)
+    assert isinstance(result, ObjectDeleted)
+    assert result.code == "ObjectDeleted"
+    assert result.object_id == "0x5"
+    assert result.digest == "dgst"
+    assert result.version == "2"
+
+
+def test_version_too_high() -> None:
+    """VersionTooHigh status yields str versions and leaves input intact."""
+    indata = {
+        "status": "VersionTooHigh",
+        "details": {
+            "asked_version": 3,
+            "latest_version": 2,
+            "object_id": "0x4",
+        },
+    }
+    original = copy.deepcopy(indata)
+    result = ObjectRead.differentiate(indata)
+    assert isinstance(result, ObjectVersionTooHigh)
+    assert result.asked_version == "3"
+    assert result.latest_version == "2"
+    assert result.code == "VersionTooHigh"
+    assert indata == original
+
+
+def test_shared_object_no_mutation() -> None:
+    """Reading a shared object does not mutate the inbound result."""
+    indata = {
+        "data": {
+            "objectId": "0x111",
+            "version": 1,
+            "digest": "dgst",
+            "type": "0x9::m::S",
+            "owner": {"Shared": {"initial_shared_version": 3}},
+            "content": {
+                "dataType": "moveObject",
+                "type": "0x9::m::S",
+                "hasPublicTransfer": True,
+                "fields": {"a": 1, "id": {"id": "0x111"}},
+            },
+        }
+    }
+    original = copy.deepcopy(indata)
+    result = ObjectRead.differentiate(indata)
+    assert isinstance(result, ObjectRead)
+    assert result.version == "1"
+    assert isinstance(result.content, SuiData)
+    assert result.content.fields["id"] == "0x111"
+    assert isinstance(result.owner, SharedOwner)
+    assert result.owner.initial_shared_version == "3"
+    assert result.owner.mutable is True
+    assert indata == original
+
+
+def test_address_owner() -> None:
+    """AddressOwner owner yields an AddressOwner."""
+    result = _owned_read({"AddressOwner": "0xa"})
+    assert isinstance(result.owner, AddressOwner)
+    assert result.owner.owner_type == "AddressOwner"
+    assert result.owner.address_owner == "0xa"
+
+
+def test_object_owner() -> None:
+    """ObjectOwner owner yields an ObjectOwner."""
+    result = _owned_read({"ObjectOwner": "0xb"})
+    assert isinstance(result.owner, ObjectOwner)
+    assert result.owner.owner_type == "ObjectOwner"
+    assert result.owner.object_owner == "0xb"
+
+
+def test_immutable_owner() -> None:
+    """Both the str and dict forms of Immutable yield an ImmutableOwner."""
+    for owner in ("Immutable", {"Immutable": None}):
+        result = _owned_read(owner)
+        assert isinstance(result.owner, ImmutableOwner)
+        assert result.owner.owner_type == "Immutable"
+
+
+def test_from_data_matches_from_dict() -> None:
+    """from_data coerces int values to str just as from_dict does."""
+    indata = {
+        "objectId": "0x1",
+        "version": 7,
+        "storageRebate": 988,
+        "digest": "dgst",
+        "type": "0x9::m::S",
+        "owner": {"AddressOwner": "0xa"},
+        "content": {
+            "dataType": "moveObject",
+            "type": "0x9::m::S",
+            "hasPublicTransfer": False,
+            "fields": {"a": 1, "id": {"id": "0x1"}},
+        },
+    }
+    result = ObjectRead.from_data(copy.deepcopy(indata))
+    assert result.version == "7"
+    assert result.storage_rebate == "988"
+    assert result == ObjectRead.from_dict(copy.deepcopy(indata))
+
+
+def test_coin_balance() -> None:
+    """Non-SUI coins have an int balance."""
+    result = _content_read(
+        "0x2::coin::Coin<0xa::usdc::USDC>", {"balance": "100"}
+    )
+    assert isinstance(result.content, SuiCoin)
+    assert result.balance == 100
+
+
+def test_data_balance() -> None:
+    """Non-coin objects have no balance."""
+    result = _content_read("0x9::m::S", {"a": 1})
+    assert isinstance(result.content, SuiData)
+    with pytest.raises(AttributeError):
+        result.balance
+
+
+def test_contentless_object_serializes() -> None:
+    """An object read without content round trips to JSON."""
+    result = ObjectRead.differentiate(
+        {"data": {"objectId": "0x1", "version": "1", "digest": "dgst"}}
+    )
+    assert isinstance(result, ObjectRead)
+    assert '"objectId": "0x1"' in result.to_json()